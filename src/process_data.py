@@ -4,14 +4,44 @@
 
 輸出：
 - data/processed/queries_raw.json: 100 筆 QA 對
-- data/processed/corpus_raw.json: 5000 篇文檔
+- data/processed/corpus_raw.jsonl: 5000 篇文檔 (JSON Lines，每行一篇)
 """
 
 import json
 import uuid
 import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from hashlib import blake2b, sha1
+
+# xxhash 提供 C 實作的 xxh3 雜湊；未安裝時退回 hashlib.blake2b
+try:
+    from xxhash import xxh3_64 as _xxh3_hasher
+    from xxhash import xxh3_64_intdigest as _xxh3
+except ImportError:
+    _xxh3 = None
+    _xxh3_hasher = None
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
+# orjson (C 實作) 比 stdlib json 快約 5 倍；未安裝時退回 stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson 提供事件驅動的串流解析，讓尖峰記憶體降為 O(單筆記錄)；
+# 優先使用 yajl2_c 後端，未安裝時退回一次載入整個檔案
+try:
+    import ijson
+
+    try:
+        _ijson_backend = ijson.get_backend("yajl2_c")
+    except ImportError:
+        _ijson_backend = ijson
+except ImportError:
+    ijson = None
+
 # 設定隨機種子以確保可重現性
 random.seed(42)
 
@@ -32,18 +62,107 @@ SAMPLING_CONFIG = {
 TOTAL_CORPUS_SIZE = 5000
 
 
+# uuid.uuid5 的 namespace bytes，在模組載入時算好一次
+_NS = uuid.NAMESPACE_DNS.bytes
+
+
+def context_fingerprint(text: str) -> int:
+    """
+    計算 context 的 64-bit 指紋。
+    去重集合只存整數指紋而非完整字串，數千筆 context 下
+    記憶體從數十 MB 縮為數十 KB；64-bit 下碰撞機率可忽略。
+    """
+    if _xxh3 is not None:
+        return _xxh3(text.encode())
+    return int.from_bytes(blake2b(text.encode(), digest_size=8).digest(), "big")
+
+
+def sentences_fingerprint(sentences: list[str]) -> int:
+    """
+    等同 context_fingerprint(" ".join(sentences))，
+    但逐句串流餵入雜湊，不必先配置合併後的完整字串。
+    """
+    h = _xxh3_hasher() if _xxh3_hasher is not None else blake2b(digest_size=8)
+    for i, sentence in enumerate(sentences):
+        if i:
+            h.update(b" ")
+        h.update(sentence.encode())
+    if _xxh3_hasher is not None:
+        return h.intdigest()
+    return int.from_bytes(h.digest(), "big")
+
+
+# 每個來源的前綴只編碼一次；ID 生成時分段 update 餵入 SHA1，
+# 不再為每次呼叫組 f-string 再整串重新編碼
+_DOC_PREFIXES = {
+    src: f"{src}:".encode()
+    for src in ("drcd", "squad_v2", "ms_marco", "hotpotqa", "2wiki")
+}
+_Q_PREFIXES = {src: f"q:{src}:".encode() for src in _DOC_PREFIXES}
+
+
+def _uuid5_hex(prefix: bytes, original_id: str) -> str:
+    """
+    等價於 str(uuid.uuid5(uuid.NAMESPACE_DNS, prefix + original_id))，
+    但直接用 sha1 計算，省去每次呼叫重建 UUID 物件的開銷。
+    """
+    h = sha1(_NS)
+    h.update(prefix)
+    h.update(str(original_id).encode())
+    b = bytearray(h.digest()[:16])
+    b[6] = (b[6] & 0x0F) | 0x50  # version 5
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    hx = b.hex()
+    return f"{hx[:8]}-{hx[8:12]}-{hx[12:16]}-{hx[16:20]}-{hx[20:]}"
+
+
+# 兩個 ID 產生器都是 (source, original_id) 的純函式，
+# 重複呼叫時直接回傳快取結果，省下 SHA1 重算
+@lru_cache(maxsize=200_000)
 def generate_doc_id(source: str, original_id: str) -> str:
     """生成唯一的文檔 ID"""
-    return str(uuid.uuid5(uuid.NAMESPACE_DNS, f"{source}:{original_id}"))
+    prefix = _DOC_PREFIXES.get(source) or f"{source}:".encode()
+    return _uuid5_hex(prefix, original_id)
 
 
+@lru_cache(maxsize=200_000)
 def generate_question_id(source: str, original_id: str) -> str:
     """生成唯一的問題 ID"""
-    return str(uuid.uuid5(uuid.NAMESPACE_DNS, f"q:{source}:{original_id}"))
+    prefix = _Q_PREFIXES.get(source) or f"q:{source}:".encode()
+    return _uuid5_hex(prefix, original_id)
+
+
+def iter_json_array(filepath: Path) -> Iterator[dict]:
+    """逐筆走訪 JSON 陣列的頂層元素，避免整個檔案駐留記憶體"""
+    if ijson is not None:
+        with open(filepath, "rb") as f:
+            yield from _ijson_backend.items(f, "item", use_float=True)
+    else:
+        yield from load_json(filepath)
+
+
+def reservoir_sample(iterable: Iterable, k: int) -> list:
+    """
+    水塘抽樣 (Algorithm R)：從串流中均勻抽取最多 k 筆，記憶體 O(k)。
+    回傳前會打亂順序，使結果可直接依序取用。
+    """
+    reservoir: list = []
+    for n, item in enumerate(iterable):
+        if n < k:
+            reservoir.append(item)
+        else:
+            j = random.randint(0, n)
+            if j < k:
+                reservoir[j] = item
+    random.shuffle(reservoir)
+    return reservoir
 
 
 def load_json(filepath: Path) -> list[dict]:
     """載入 JSON 檔案"""
+    if orjson is not None:
+        # 直接讀 bytes，省去 Python 層的 UTF-8 解碼
+        return orjson.loads(filepath.read_bytes())
     with open(filepath, "r", encoding="utf-8") as f:
         return json.load(f)
 
@@ -51,13 +170,32 @@ def load_json(filepath: Path) -> list[dict]:
 def save_json(data: list[dict], filepath: Path) -> None:
     """儲存 JSON 檔案"""
     filepath.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        filepath.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        return
     with open(filepath, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
 
+def save_jsonl(data: list[dict], filepath: Path) -> None:
+    """以 JSON Lines 格式儲存 (每行一筆)，省去縮排成本並支援串流讀取"""
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        with open(filepath, "wb") as f:
+            for record in data:
+                f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+        return
+    with open(filepath, "w", encoding="utf-8") as f:
+        for record in data:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
+
+
 def process_drcd(
-    data: list[dict], count: int
-) -> tuple[list[dict], list[dict], set[str]]:
+    data: Iterable[dict], count: int
+) -> tuple[list[dict], list[dict], set[int]]:
     """
     處理 DRCD 資料集
     結構: [{title, paragraphs: [{context, qas: [{question, answers, id}]}]}]
@@ -65,40 +203,40 @@ def process_drcd(
     Returns:
         queries: QA 列表
         gold_docs: 黃金文檔列表
-        used_contexts: 已使用的 context 集合
+        used_contexts: 已使用 context 的指紋集合
     """
     queries = []
     gold_docs = []
-    used_contexts: set[str] = set()
-
-    # 展平所有 QA 對並記錄其 context
-    all_qas = []
-    for article in data:
-        for para in article.get("paragraphs", []):
-            context = para.get("context", "")
-            if not context or context in used_contexts:
-                continue
-            for qa in para.get("qas", []):
-                all_qas.append(
-                    {
-                        "qa": qa,
-                        "context": context,
-                        "title": article.get("title", ""),
-                    }
-                )
+    used_contexts: set[int] = set()
+
+    # 單趟串流走訪：每個段落只產生一個候選並帶著其全部 QA，
+    # 不再逐 QA 展平（舊版在此處的 used_contexts 檢查永遠為空集合，已移除）
+    def iter_paragraphs():
+        for article in data:
+            for para in article.get("paragraphs", []):
+                context = para.get("context", "")
+                if not context or not para.get("qas"):
+                    continue
+                yield {
+                    "qas": para["qas"],
+                    "context": context,
+                    "title": article.get("title", ""),
+                }
 
-    # 隨機打亂並選取（確保每個 context 只選一個 QA）
-    random.shuffle(all_qas)
+    # 水塘抽樣取代全量 shuffle；多抽 10 倍以涵蓋重複 context 造成的剔除
+    candidates = reservoir_sample(iter_paragraphs(), count * 10)
 
-    for item in all_qas:
+    for item in candidates:
         if len(queries) >= count:
             break
 
         context = item["context"]
-        if context in used_contexts:
+        ctx_fp = context_fingerprint(context)
+        if ctx_fp in used_contexts:
             continue
 
-        qa = item["qa"]
+        # 每個 context 隨機選一個 QA
+        qa = random.choice(item["qas"])
         original_id = qa.get("id", str(uuid.uuid4()))
         doc_id = generate_doc_id("drcd", original_id)
         question_id = generate_question_id("drcd", original_id)
@@ -128,15 +266,15 @@ def process_drcd(
             }
         )
 
-        used_contexts.add(context)
+        used_contexts.add(ctx_fp)
 
     print(f"[DRCD] 提取 {len(queries)} 題 QA, {len(gold_docs)} 篇黃金文檔")
     return queries, gold_docs, used_contexts
 
 
 def process_squad_v2(
-    data: list[dict], count: int
-) -> tuple[list[dict], list[dict], set[str]]:
+    data: Iterable[dict], count: int
+) -> tuple[list[dict], list[dict], set[int]]:
     """
     處理 SQuAD v2 資料集
     結構: [{id, title, context, question, answers: {text: [], answer_start: []}}]
@@ -146,35 +284,34 @@ def process_squad_v2(
     Returns:
         queries: QA 列表
         gold_docs: 黃金文檔列表
-        used_contexts: 已使用的 context 集合
+        used_contexts: 已使用 context 的指紋集合
     """
     queries = []
     gold_docs = []
-    used_contexts: set[str] = set()
+    used_contexts: set[int] = set()
 
-    # 過濾出有答案的題目，並展平
-    answerable = []
-    for item in data:
-        answers = item.get("answers", {})
-        answer_texts = answers.get("text", [])
-        if not answer_texts:
-            continue  # 跳過不可回答的問題
+    # 串流過濾出有答案的題目
+    def iter_answerable():
+        for item in data:
+            answers = item.get("answers", {})
+            if not answers.get("text", []):
+                continue  # 跳過不可回答的問題
 
-        context = item.get("context", "")
-        if not context:
-            continue
+            if not item.get("context", ""):
+                continue
 
-        answerable.append(item)
+            yield item
 
-    # 隨機打亂
-    random.shuffle(answerable)
+    # 水塘抽樣取代全量 shuffle；多抽 10 倍以涵蓋重複 context 造成的剔除
+    answerable = reservoir_sample(iter_answerable(), count * 10)
 
     for item in answerable:
         if len(queries) >= count:
             break
 
         context = item.get("context", "")
-        if context in used_contexts:
+        ctx_fp = context_fingerprint(context)
+        if ctx_fp in used_contexts:
             continue
 
         original_id = item.get("id", str(uuid.uuid4()))
@@ -205,15 +342,15 @@ def process_squad_v2(
             }
         )
 
-        used_contexts.add(context)
+        used_contexts.add(ctx_fp)
 
     print(f"[SQuAD v2] 提取 {len(queries)} 題 QA, {len(gold_docs)} 篇黃金文檔")
     return queries, gold_docs, used_contexts
 
 
 def process_ms_marco(
-    data: list[dict], count: int
-) -> tuple[list[dict], list[dict], list[dict], set[str]]:
+    data: Iterable[dict], count: int
+) -> tuple[list[dict], list[dict], list[dict], set[int]]:
     """
     處理 MS MARCO v2.1 資料集
     結構: [{query_id, query, query_type,
@@ -226,31 +363,31 @@ def process_ms_marco(
         queries: QA 列表
         gold_docs: 黃金文檔列表
         hard_negatives: 困難負樣本列表 (同 query 下未選中的段落)
-        used_contexts: 已使用的 context 集合
+        used_contexts: 已使用 context 的指紋集合
     """
     queries = []
     gold_docs = []
     hard_negatives = []
-    used_contexts: set[str] = set()
-
-    # 過濾有效的 query
-    valid_items = []
-    for item in data:
-        answers = item.get("answers", [])
-        # 跳過無答案的 query
-        if not answers or answers == ["No Answer Present."]:
-            continue
+    used_contexts: set[int] = set()
 
-        passages = item.get("passages", {})
-        is_selected = passages.get("is_selected", [])
-        # 確保至少有一個被選中的段落
-        if 1 not in is_selected:
-            continue
+    # 串流過濾有效的 query
+    def iter_valid():
+        for item in data:
+            answers = item.get("answers", [])
+            # 跳過無答案的 query
+            if not answers or answers == ["No Answer Present."]:
+                continue
 
-        valid_items.append(item)
+            passages = item.get("passages", {})
+            is_selected = passages.get("is_selected", [])
+            # 確保至少有一個被選中的段落
+            if 1 not in is_selected:
+                continue
+
+            yield item
 
-    # 隨機打亂
-    random.shuffle(valid_items)
+    # 水塘抽樣取代全量 shuffle；多抽 10 倍以涵蓋重複 context 造成的剔除
+    valid_items = reservoir_sample(iter_valid(), count * 10)
 
     for item in valid_items:
         if len(queries) >= count:
@@ -263,38 +400,51 @@ def process_ms_marco(
         is_selected_list = passages.get("is_selected", [])
         passage_texts = passages.get("passage_text", [])
 
-        # 檢查是否有 context 已被使用
-        all_passages = [t for t in passage_texts if t and t.strip()]
-        if any(p in used_contexts for p in all_passages):
+        # 一次算好所有非空段落的 (索引, 選中與否, 文字, 指紋)，
+        # 後續的已用檢查與內層迴圈都不再重算
+        kept = [
+            (i, selected, text, context_fingerprint(text))
+            for i, (selected, text) in enumerate(zip(is_selected_list, passage_texts))
+            if text and text.strip()
+        ]
+
+        # 檢查是否有 context 已被使用 (C 層級的一次 disjoint 判斷)
+        if not used_contexts.isdisjoint(fp for _, _, _, fp in kept):
             continue
 
         gold_doc_ids = []
-        question_used_contexts = []
+        question_used_contexts = [fp for _, _, _, fp in kept]
 
-        for i, (selected, text) in enumerate(
-            zip(is_selected_list, passage_texts)
-        ):
-            if not text or not text.strip():
-                continue
+        # 先依 is_selected 分流成兩個同質列表，
+        # 迴圈本體不再逐段落判斷 gold / hard-negative 分支
+        gold_kept = [(i, text) for i, selected, text, _ in kept if selected == 1]
+        neg_kept = [(i, text) for i, selected, text, _ in kept if selected != 1]
 
+        for i, text in gold_kept:
             doc_original_id = f"{original_id}_p{i}"
             doc_id = generate_doc_id("ms_marco", doc_original_id)
+            gold_docs.append(
+                {
+                    "doc_id": doc_id,
+                    "content": text,
+                    "original_source": "ms_marco",
+                    "original_id": doc_original_id,
+                    "is_gold": True,
+                }
+            )
+            gold_doc_ids.append(doc_id)
 
-            doc = {
-                "doc_id": doc_id,
-                "content": text,
-                "original_source": "ms_marco",
-                "original_id": doc_original_id,
-                "is_gold": selected == 1,
-            }
-
-            if selected == 1:
-                gold_docs.append(doc)
-                gold_doc_ids.append(doc_id)
-            else:
-                hard_negatives.append(doc)
-
-            question_used_contexts.append(text)
+        for i, text in neg_kept:
+            doc_original_id = f"{original_id}_p{i}"
+            hard_negatives.append(
+                {
+                    "doc_id": generate_doc_id("ms_marco", doc_original_id),
+                    "content": text,
+                    "original_source": "ms_marco",
+                    "original_id": doc_original_id,
+                    "is_gold": False,
+                }
+            )
 
         if gold_doc_ids:
             answers = item.get("answers", [])
@@ -319,8 +469,8 @@ def process_ms_marco(
 
 
 def process_hotpotqa(
-    data: list[dict], count: int
-) -> tuple[list[dict], list[dict], list[dict], set[str]]:
+    data: Iterable[dict], count: int
+) -> tuple[list[dict], list[dict], list[dict], set[int]]:
     """
     處理 HotpotQA 資料集
     結構: [{id, question, answer, supporting_facts: {title, sent_id},
@@ -330,18 +480,18 @@ def process_hotpotqa(
         queries: QA 列表
         gold_docs: 黃金文檔列表
         hard_negatives: 困難負樣本列表
-        used_contexts: 已使用的 context 集合
+        used_contexts: 已使用 context 的指紋集合
     """
     queries = []
     gold_docs = []
     hard_negatives = []
-    used_contexts: set[str] = set()
+    used_contexts: set[int] = set()
 
-    # 隨機打亂
-    data_copy = data.copy()
-    random.shuffle(data_copy)
+    # 水塘抽樣取代全量物化 + shuffle；多抽 10 倍以涵蓋
+    # 重複 context 或無黃金文檔造成的剔除
+    candidates = reservoir_sample(data, count * 10)
 
-    for item in data_copy:
+    for item in candidates:
         if len(queries) >= count:
             break
 
@@ -361,25 +511,21 @@ def process_hotpotqa(
         gold_doc_ids = []
         question_used_contexts = []
 
-        for i, title in enumerate(titles):
-            if i >= len(sentences_list):
+        for title, sentences in zip(titles, sentences_list):
+            if not isinstance(sentences, list):
+                sentences = [str(sentences)]
+            if not any(s.strip() for s in sentences):
                 continue
 
-            # 合併句子為完整段落
-            sentences = sentences_list[i]
-            content = (
-                " ".join(sentences) if isinstance(sentences, list) else str(sentences)
-            )
-
-            if not content.strip():
+            # 先對句子串流算指紋，確定要保留後才合併成完整段落
+            content_fp = sentences_fingerprint(sentences)
+            if content_fp in used_contexts:
+                # 如果 context 已被使用，跳過此問題
                 continue
 
             doc_original_id = f"{original_id}_{title}"
             doc_id = generate_doc_id("hotpotqa", doc_original_id)
-
-            if content in used_contexts:
-                # 如果 context 已被使用，跳過此問題
-                continue
+            content = " ".join(sentences)
 
             doc = {
                 "doc_id": doc_id,
@@ -395,7 +541,7 @@ def process_hotpotqa(
             else:
                 hard_negatives.append(doc)
 
-            question_used_contexts.append(content)
+            question_used_contexts.append(content_fp)
 
         # 只有當有黃金文檔時才添加問題
         if gold_doc_ids:
@@ -418,8 +564,8 @@ def process_hotpotqa(
 
 
 def process_2wiki(
-    data: list[dict], count: int
-) -> tuple[list[dict], list[dict], list[dict], set[str]]:
+    data: Iterable[dict], count: int
+) -> tuple[list[dict], list[dict], list[dict], set[int]]:
     """
     處理 2WikiMultiHopQA 資料集
     結構類似 HotpotQA
@@ -427,13 +573,13 @@ def process_2wiki(
     queries = []
     gold_docs = []
     hard_negatives = []
-    used_contexts: set[str] = set()
+    used_contexts: set[int] = set()
 
-    # 隨機打亂
-    data_copy = data.copy()
-    random.shuffle(data_copy)
+    # 水塘抽樣取代全量物化 + shuffle；多抽 10 倍以涵蓋
+    # 重複 context 或無黃金文檔造成的剔除
+    candidates = reservoir_sample(data, count * 10)
 
-    for item in data_copy:
+    for item in candidates:
         if len(queries) >= count:
             break
 
@@ -453,24 +599,20 @@ def process_2wiki(
         gold_doc_ids = []
         question_used_contexts = []
 
-        for i, title in enumerate(titles):
-            if i >= len(sentences_list):
+        for title, sentences in zip(titles, sentences_list):
+            if not isinstance(sentences, list):
+                sentences = [str(sentences)]
+            if not any(s.strip() for s in sentences):
                 continue
 
-            # 合併句子為完整段落
-            sentences = sentences_list[i]
-            content = (
-                " ".join(sentences) if isinstance(sentences, list) else str(sentences)
-            )
-
-            if not content.strip():
+            # 先對句子串流算指紋，確定要保留後才合併成完整段落
+            content_fp = sentences_fingerprint(sentences)
+            if content_fp in used_contexts:
                 continue
 
             doc_original_id = f"{original_id}_{title}"
             doc_id = generate_doc_id("2wiki", doc_original_id)
-
-            if content in used_contexts:
-                continue
+            content = " ".join(sentences)
 
             doc = {
                 "doc_id": doc_id,
@@ -486,7 +628,7 @@ def process_2wiki(
             else:
                 hard_negatives.append(doc)
 
-            question_used_contexts.append(content)
+            question_used_contexts.append(content_fp)
 
         # 只有當有黃金文檔時才添加問題
         if gold_doc_ids:
@@ -509,78 +651,96 @@ def process_2wiki(
 
 
 def collect_random_negatives(
-    drcd_data: list[dict],
-    squad_v2_data: list[dict],
-    ms_marco_data: list[dict],
-    used_contexts: set[str],
+    drcd_path: Path,
+    squad_v2_path: Path,
+    ms_marco_path: Path,
+    used_contexts: set[int],
     target_count: int,
 ) -> list[dict]:
     """
     從多個資料集的未使用段落中收集隨機負樣本。
+    對原始檔做第二次串流掃描，而非重用記憶體中的資料。
     來源: DRCD, SQuAD v2, MS MARCO
     """
-    random_negatives = []
-    neg_counter = 0
-
-    # 從 DRCD 收集
-    for article in drcd_data:
-        for para in article.get("paragraphs", []):
-            context = para.get("context", "")
-            if context and context not in used_contexts:
-                doc_id = generate_doc_id("drcd", f"neg_{neg_counter}")
-                random_negatives.append(
-                    {
-                        "doc_id": doc_id,
+
+    def is_new_context(text: str) -> bool:
+        """測試與插入合一：只算一次指紋、只探測一次集合"""
+        fp = context_fingerprint(text)
+        before = len(used_contexts)
+        used_contexts.add(fp)
+        return len(used_contexts) != before
+
+    def iter_candidates():
+        neg_counter = 0
+
+        # 從 DRCD 收集
+        for article in iter_json_array(drcd_path):
+            for para in article.get("paragraphs", []):
+                context = para.get("context", "")
+                if context and is_new_context(context):
+                    yield {
+                        "doc_id": generate_doc_id("drcd", f"neg_{neg_counter}"),
                         "content": context,
                         "original_source": "drcd",
                         "original_id": para.get("id", ""),
                         "is_gold": False,
                     }
-                )
-                used_contexts.add(context)
-                neg_counter += 1
-
-    # 從 SQuAD v2 收集
-    for item in squad_v2_data:
-        context = item.get("context", "")
-        if context and context not in used_contexts:
-            doc_id = generate_doc_id("squad_v2", f"neg_{neg_counter}")
-            random_negatives.append(
-                {
-                    "doc_id": doc_id,
+                    neg_counter += 1
+
+        # 從 SQuAD v2 收集
+        for item in iter_json_array(squad_v2_path):
+            context = item.get("context", "")
+            if context and is_new_context(context):
+                yield {
+                    "doc_id": generate_doc_id("squad_v2", f"neg_{neg_counter}"),
                     "content": context,
                     "original_source": "squad_v2",
                     "original_id": item.get("id", ""),
                     "is_gold": False,
                 }
-            )
-            used_contexts.add(context)
-            neg_counter += 1
+                neg_counter += 1
 
-    # 從 MS MARCO 收集
-    for item in ms_marco_data:
-        passages = item.get("passages", {})
-        passage_texts = passages.get("passage_text", [])
-        for i, text in enumerate(passage_texts):
-            if text and text.strip() and text not in used_contexts:
-                doc_id = generate_doc_id("ms_marco", f"neg_{neg_counter}")
-                random_negatives.append(
-                    {
-                        "doc_id": doc_id,
+        # 從 MS MARCO 收集
+        for item in iter_json_array(ms_marco_path):
+            passages = item.get("passages", {})
+            passage_texts = passages.get("passage_text", [])
+            for i, text in enumerate(passage_texts):
+                if text and text.strip() and is_new_context(text):
+                    yield {
+                        "doc_id": generate_doc_id("ms_marco", f"neg_{neg_counter}"),
                         "content": text,
                         "original_source": "ms_marco",
                         "original_id": f"{item.get('query_id', '')}_{i}",
                         "is_gold": False,
                     }
-                )
-                used_contexts.add(text)
-                neg_counter += 1
+                    neg_counter += 1
+
+    # 水塘抽樣直接取出 target_count 篇，免去全量收集後再 shuffle
+    seen = 0
 
-    print(f"  - 可用的隨機負樣本總數: {len(random_negatives)} 篇")
+    def counted():
+        nonlocal seen
+        for doc in iter_candidates():
+            seen += 1
+            yield doc
 
-    # 隨機打亂並取需要的數量
-    random.shuffle(random_negatives)
-    return random_negatives[:target_count]
+    random_negatives = reservoir_sample(counted(), target_count)
+    print(f"  - 可用的隨機負樣本總數: {seen} 篇")
+    return random_negatives
+
+
+def _process_dataset(source: str, filepath: Path, count: int):
+    """子行程進入點：串流處理單一資料集 (供 ProcessPoolExecutor 使用)"""
+    # 每個 worker 以來源名稱派生的固定種子重新播種，維持可重現性
+    random.seed(f"42:{source}")
+    process_fn = {
+        "drcd": process_drcd,
+        "squad_v2": process_squad_v2,
+        "ms_marco": process_ms_marco,
+        "hotpotqa": process_hotpotqa,
+        "2wiki": process_2wiki,
+    }[source]
+    return process_fn(iter_json_array(filepath), count)
 
 
 def main():
@@ -588,45 +748,32 @@ def main():
     print("開始資料提取與處理")
     print("=" * 60)
 
-    # 載入原始資料
-    print("\n[1/6] 載入原始資料...")
-    drcd_data = load_json(RAW_DIR / "drcd.json")
-    squad_v2_data = load_json(RAW_DIR / "squad_v2.json")
-    ms_marco_data = load_json(RAW_DIR / "ms_marco.json")
-    hotpotqa_data = load_json(RAW_DIR / "hotpotqa.json")
-    wiki2_data = load_json(RAW_DIR / "2wiki.json")
-
-    print(f"  - DRCD: {len(drcd_data)} 篇文章")
-    print(f"  - SQuAD v2: {len(squad_v2_data)} 筆記錄")
-    print(f"  - MS MARCO: {len(ms_marco_data)} 筆記錄")
-    print(f"  - HotpotQA: {len(hotpotqa_data)} 筆記錄")
-    print(f"  - 2Wiki: {len(wiki2_data)} 筆記錄")
-
-    # 處理各資料集
-    print("\n[2/6] 處理 DRCD...")
-    drcd_queries, drcd_gold_docs, drcd_used = process_drcd(
-        drcd_data, SAMPLING_CONFIG["drcd"]["count"]
-    )
-
-    print("\n[3/6] 處理 SQuAD v2...")
-    squad_queries, squad_gold_docs, squad_used = process_squad_v2(
-        squad_v2_data, SAMPLING_CONFIG["squad_v2"]["count"]
-    )
-
-    print("\n[4/6] 處理 MS MARCO...")
-    marco_queries, marco_gold_docs, marco_hard_negs, marco_used = process_ms_marco(
-        ms_marco_data, SAMPLING_CONFIG["ms_marco"]["count"]
-    )
-
-    print("\n[5/6] 處理 HotpotQA...")
-    hotpot_queries, hotpot_gold_docs, hotpot_hard_negs, hotpot_used = process_hotpotqa(
-        hotpotqa_data, SAMPLING_CONFIG["hotpotqa"]["count"]
-    )
-
-    print("\n[6/6] 處理 2WikiMultiHopQA...")
-    wiki2_queries, wiki2_gold_docs, wiki2_hard_negs, wiki2_used = process_2wiki(
-        wiki2_data, SAMPLING_CONFIG["2wiki"]["count"]
-    )
+    # 原始資料改以串流逐筆讀取，避免五個資料集同時駐留記憶體
+    print("\n[1/2] 開啟原始資料 (串流模式)...")
+    for name in SAMPLING_CONFIG:
+        print(f"  - {RAW_DIR / f'{name}.json'}")
+
+    # 五個資料集彼此獨立，交給獨立行程並行處理以繞過 GIL
+    print("\n[2/2] 並行處理五個資料集 (5 workers)...")
+    with ProcessPoolExecutor(max_workers=len(SAMPLING_CONFIG)) as executor:
+        futures = {
+            source: executor.submit(
+                _process_dataset,
+                source,
+                RAW_DIR / f"{source}.json",
+                config["count"],
+            )
+            for source, config in SAMPLING_CONFIG.items()
+        }
+        results = {source: future.result() for source, future in futures.items()}
+
+    drcd_queries, drcd_gold_docs, drcd_used = results["drcd"]
+    squad_queries, squad_gold_docs, squad_used = results["squad_v2"]
+    marco_queries, marco_gold_docs, marco_hard_negs, marco_used = results["ms_marco"]
+    hotpot_queries, hotpot_gold_docs, hotpot_hard_negs, hotpot_used = results[
+        "hotpotqa"
+    ]
+    wiki2_queries, wiki2_gold_docs, wiki2_hard_negs, wiki2_used = results["2wiki"]
 
     # 合併所有 queries
     all_queries = (
@@ -662,8 +809,11 @@ def main():
     # 收集隨機負樣本
     if needed_random_negs > 0:
         random_negatives = collect_random_negatives(
-            drcd_data, squad_v2_data, ms_marco_data,
-            all_used_contexts, needed_random_negs
+            RAW_DIR / "drcd.json",
+            RAW_DIR / "squad_v2.json",
+            RAW_DIR / "ms_marco.json",
+            all_used_contexts,
+            needed_random_negs,
         )
         print(f"  - 收集到隨機負樣本: {len(random_negatives)} 篇")
     else:
@@ -694,9 +844,9 @@ def main():
     # 儲存輸出
     print("\n[儲存輸出]")
     save_json(all_queries, PROCESSED_DIR / "queries_raw.json")
-    save_json(all_corpus, PROCESSED_DIR / "corpus_raw.json")
+    save_jsonl(all_corpus, PROCESSED_DIR / "corpus_raw.jsonl")
     print(f"  - 已儲存: {PROCESSED_DIR / 'queries_raw.json'}")
-    print(f"  - 已儲存: {PROCESSED_DIR / 'corpus_raw.json'}")
+    print(f"  - 已儲存: {PROCESSED_DIR / 'corpus_raw.jsonl'}")
 
     print(f"\n{'=' * 60}")
     print("處理完成！")
@@ -1,6 +1,6 @@
 """
 問題抽換腳本
-將指定的問題抽換為同資料集的另一題，並同步更新 queries.json 與 corpus.json。
+將指定的問題抽換為同資料集的另一題，並同步更新 queries.json 與 corpus.jsonl。
 
 使用方式:
     uv run src/replace_question.py <question_id>
@@ -18,6 +18,12 @@ from pathlib import Path
 from dotenv import load_dotenv
 from openai import OpenAI
 
+# orjson (C 實作) 比 stdlib json 快約 5 倍；未安裝時退回 stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 載入環境變數
 load_dotenv()
 
@@ -37,15 +43,40 @@ if sys.stdout.encoding != "utf-8":
 
 
 def load_json(filepath: Path) -> list[dict]:
+    if orjson is not None:
+        return orjson.loads(filepath.read_bytes())
     with open(filepath, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
 def save_json(data: list[dict], filepath: Path) -> None:
+    if orjson is not None:
+        filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
     with open(filepath, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
 
+def load_jsonl(filepath: Path) -> list[dict]:
+    if orjson is not None:
+        with open(filepath, "rb") as f:
+            return [orjson.loads(line) for line in f]
+    with open(filepath, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def save_jsonl(data: list[dict], filepath: Path) -> None:
+    if orjson is not None:
+        with open(filepath, "wb") as f:
+            for record in data:
+                f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+        return
+    with open(filepath, "w", encoding="utf-8") as f:
+        for record in data:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
+
+
 def generate_doc_id(source: str, original_id: str) -> str:
     return str(uuid.uuid5(uuid.NAMESPACE_DNS, f"{source}:{original_id}"))
 
@@ -604,9 +635,9 @@ def main():
     # 載入現有資料
     print("\n[1/6] 載入現有資料...")
     queries = load_json(PROCESSED_DIR / "queries.json")
-    corpus = load_json(PROCESSED_DIR / "corpus.json")
+    corpus = load_jsonl(PROCESSED_DIR / "corpus.jsonl")
     queries_raw = load_json(PROCESSED_DIR / "queries_raw.json")
-    corpus_raw = load_json(PROCESSED_DIR / "corpus_raw.json")
+    corpus_raw = load_jsonl(PROCESSED_DIR / "corpus_raw.jsonl")
 
     # 找到要抽換的問題
     target_query = None
@@ -685,7 +716,7 @@ def main():
             break
 
     # 更新 corpus
-    print("[6/6] 更新 corpus.json 與 corpus_raw.json...")
+    print("[6/6] 更新 corpus.jsonl 與 corpus_raw.jsonl...")
 
     # 移除舊的黃金文檔 (只移除該問題專屬的黃金文檔)
     # 注意: 對於 multi-hop，同時移除 hard negatives
@@ -747,9 +778,9 @@ def main():
 
     # 儲存
     save_json(queries, PROCESSED_DIR / "queries.json")
-    save_json(corpus, PROCESSED_DIR / "corpus.json")
+    save_jsonl(corpus, PROCESSED_DIR / "corpus.jsonl")
     save_json(queries_raw, PROCESSED_DIR / "queries_raw.json")
-    save_json(corpus_raw, PROCESSED_DIR / "corpus_raw.json")
+    save_jsonl(corpus_raw, PROCESSED_DIR / "corpus_raw.jsonl")
 
     print(f"\n{'=' * 60}")
     print("抽換完成！")
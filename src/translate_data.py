@@ -5,11 +5,11 @@
 
 輸入：
 - data/processed/queries_raw.json (100 筆 QA)
-- data/processed/corpus_raw.json (5000 篇文檔)
+- data/processed/corpus_raw.jsonl (5000 篇文檔)
 
 輸出：
 - data/processed/queries.json
-- data/processed/corpus.json
+- data/processed/corpus.jsonl
 """
 
 import json
@@ -22,6 +22,12 @@ from dotenv import load_dotenv
 from openai import OpenAI
 from tqdm import tqdm
 
+# orjson (C 實作) 比 stdlib json 快約 5 倍；未安裝時退回 stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 載入環境變數
 load_dotenv()
 
@@ -40,6 +46,8 @@ MAX_RETRIES = 5  # 最大重試次數
 
 def load_json(filepath: Path) -> list[dict]:
     """載入 JSON 檔案"""
+    if orjson is not None:
+        return orjson.loads(filepath.read_bytes())
     with open(filepath, "r", encoding="utf-8") as f:
         return json.load(f)
 
@@ -47,10 +55,36 @@ def load_json(filepath: Path) -> list[dict]:
 def save_json(data: list[dict], filepath: Path) -> None:
     """儲存 JSON 檔案"""
     filepath.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
     with open(filepath, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
 
+def load_jsonl(filepath: Path) -> list[dict]:
+    """載入 JSON Lines 檔案 (每行一筆)"""
+    if orjson is not None:
+        with open(filepath, "rb") as f:
+            return [orjson.loads(line) for line in f]
+    with open(filepath, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def save_jsonl(data: list[dict], filepath: Path) -> None:
+    """以 JSON Lines 格式儲存 (每行一筆)"""
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        with open(filepath, "wb") as f:
+            for record in data:
+                f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+        return
+    with open(filepath, "w", encoding="utf-8") as f:
+        for record in data:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
+
+
 def translate_text(text: str) -> str:
     """使用 GPT-4.1 翻譯單一文本"""
     if not text or not text.strip():
@@ -149,7 +183,7 @@ def main():
 
     print("\n[載入中間檔案]")
     queries_raw = load_json(PROCESSED_DIR / "queries_raw.json")
-    corpus_raw = load_json(PROCESSED_DIR / "corpus_raw.json")
+    corpus_raw = load_jsonl(PROCESSED_DIR / "corpus_raw.jsonl")
 
     print(f"  - 問答數量: {len(queries_raw)}")
     print(f"  - 文檔數量: {len(corpus_raw)}")
@@ -176,10 +210,10 @@ def main():
     # 儲存輸出
     print("\n[儲存輸出]")
     save_json(translated_queries, PROCESSED_DIR / "queries.json")
-    save_json(translated_corpus, PROCESSED_DIR / "corpus.json")
+    save_jsonl(translated_corpus, PROCESSED_DIR / "corpus.jsonl")
 
     print(f"  - 已儲存: {PROCESSED_DIR / 'queries.json'}")
-    print(f"  - 已儲存: {PROCESSED_DIR / 'corpus.json'}")
+    print(f"  - 已儲存: {PROCESSED_DIR / 'corpus.jsonl'}")
     print("\n完成！")
 
 
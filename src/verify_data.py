@@ -3,7 +3,7 @@
 驗證處理後的資料是否符合規格與預期。
 
 驗證流程：
-0. 檔案存在性檢查 (4 個 JSON 檔案)
+0. 檔案存在性檢查 (queries 為 JSON、corpus 為 JSON Lines，共 4 個檔案)
 
 對 Raw 組 (queries_raw + corpus_raw) 與 Processed 組 (queries + corpus)
 各自執行以下驗證 (需該組兩個檔案皆存在)：
@@ -19,9 +19,16 @@
 """
 
 import json
+import re
 from pathlib import Path
 from collections import Counter
 
+# orjson (C 實作) 比 stdlib json 快約 5 倍；未安裝時退回 stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 路徑設定
 BASE_DIR = Path(__file__).parent.parent
 PROCESSED_DIR = BASE_DIR / "data" / "processed"
@@ -55,19 +62,82 @@ CORPUS_SCHEMA = {
     "is_gold": bool,
 }
 
+# msgspec 可在 C 層級一次驗證整批記錄的欄位與型別；
+# 未安裝時退回逐欄位的 Python 迴圈
+try:
+    import msgspec
+
+    class _QueryStruct(msgspec.Struct):
+        question_id: str
+        question: str
+        gold_answer: str
+        gold_doc_ids: list
+        source_dataset: str
+        question_type: str
+
+    class _CorpusStruct(msgspec.Struct):
+        doc_id: str
+        content: str
+        original_source: str
+        original_id: str
+        is_gold: bool
+
+except ImportError:
+    msgspec = None
+
+
+def _batch_schema_ok(records: list[dict], struct_type) -> bool:
+    """以 msgspec 一次驗證整批記錄；驗證失敗回傳 False 交由逐欄位迴圈找明細"""
+    try:
+        msgspec.convert(records, list[struct_type])
+        return True
+    except msgspec.ValidationError:
+        return False
+
 
 def load_json(filepath: Path) -> list[dict]:
     """載入 JSON 檔案"""
+    if orjson is not None:
+        # 直接讀 bytes，省去 Python 層的 UTF-8 解碼
+        return orjson.loads(filepath.read_bytes())
     with open(filepath, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
+def load_jsonl(filepath: Path) -> list[dict]:
+    """載入 JSON Lines 檔案 (每行一筆)"""
+    if orjson is not None:
+        with open(filepath, "rb") as f:
+            return [orjson.loads(line) for line in f]
+    with open(filepath, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+# 預編譯的 CJK 區段 regex，讓掃描在 C 層級單趟完成
+_HAN = re.compile(r"[\u4e00-\u9fff]")
+
+# 有 numba 時改走 JIT 編譯的 uint32 碼位掃描核心 (numba 本身依賴 numpy)；
+# cache=True 讓編譯結果落盤，首次呼叫後不再付編譯成本。沒有則維持 regex 路徑
+try:
+    import numpy as np
+    from numba import njit
+
+    @njit(cache=True)
+    def _any_han(codepoints) -> bool:
+        for cp in codepoints:
+            if 0x4E00 <= cp <= 0x9FFF:
+                return True
+        return False
+
+except ImportError:
+    _any_han = None
+
+
 def contains_chinese(text: str) -> bool:
     """檢查文字是否包含中文字元"""
-    for char in text:
-        if "\u4e00" <= char <= "\u9fff":
-            return True
-    return False
+    if _any_han is not None:
+        return _any_han(np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32))
+    return _HAN.search(text) is not None
 
 
 def validate_pair(
@@ -75,7 +145,7 @@ def validate_pair(
     corpus: list[dict],
     label: str,
     check_chinese: bool = False,
-) -> None:
+) -> tuple[set, set]:
     """
     對一組 (queries, corpus) 執行完整的 5 項驗證。
 
@@ -84,11 +154,52 @@ def validate_pair(
         corpus: 文檔資料列表
         label: 顯示用的標籤 (如 "Processed" 或 "Raw")
         check_chinese: 是否額外檢查中文翻譯
+
+    Returns:
+        (question_id 集合, doc_id 集合)，供呼叫端的交叉驗證重用
     """
     print(f"\n{'=' * 60}")
     print(f"[{label}] 驗證開始")
     print("=" * 60)
 
+    # 有 msgspec 時先在 C 層級整批驗證 schema，通過就跳過逐欄位迴圈；
+    # 驗證失敗 (或無 msgspec) 時才逐筆檢查以蒐集完整錯誤明細
+    q_schema_ok = msgspec is not None and _batch_schema_ok(queries, _QueryStruct)
+    c_schema_ok = msgspec is not None and _batch_schema_ok(corpus, _CorpusStruct)
+
+    # --- 單趟掃描：來源分佈、欄位檢查、ID 收集與重複統計一次完成 ---
+    sources: Counter = Counter()
+    q_field_msgs: list[str] = []
+    q_ids: list = []
+    referenced: set = set()
+    for i, q in enumerate(queries):
+        sources[q.get("source_dataset")] += 1
+        if not q_schema_ok:
+            for field, expected_type in QUERY_SCHEMA.items():
+                if field not in q:
+                    q_field_msgs.append(f"  [FAIL] queries[{i}] 缺少欄位: {field}")
+                elif not isinstance(q[field], expected_type):
+                    q_field_msgs.append(
+                        f"  [FAIL] queries[{i}].{field} 型別錯誤: "
+                        f"{type(q[field]).__name__} (預期 {expected_type.__name__})"
+                    )
+        q_ids.append(q.get("question_id"))
+        referenced.update(q.get("gold_doc_ids", []))
+
+    c_field_msgs: list[str] = []
+    doc_ids: list = []
+    for i, d in enumerate(corpus):
+        if not c_schema_ok:
+            for field, expected_type in CORPUS_SCHEMA.items():
+                if field not in d:
+                    c_field_msgs.append(f"  [FAIL] corpus[{i}] 缺少欄位: {field}")
+                elif not isinstance(d[field], expected_type):
+                    c_field_msgs.append(
+                        f"  [FAIL] corpus[{i}].{field} 型別錯誤: "
+                        f"{type(d[field]).__name__} (預期 {expected_type.__name__})"
+                    )
+        doc_ids.append(d.get("doc_id"))
+
     # --- 1. 資料數量 ---
     print(f"\n[{label} - 1. 資料數量]")
 
@@ -102,7 +213,6 @@ def validate_pair(
     else:
         print(f"  [FAIL] Corpus 數量錯誤: {len(corpus)} (預期 {EXPECTED_CORPUS})")
 
-    sources = Counter(q.get("source_dataset") for q in queries)
     if sources == EXPECTED_DISTRIBUTION:
         print(f"  [PASS] 來源分佈正確: {dict(sources)}")
     else:
@@ -111,44 +221,31 @@ def validate_pair(
     # --- 2. 欄位完整性與型別 ---
     print(f"\n[{label} - 2. 欄位完整性與型別]")
 
-    q_field_errors = 0
-    for i, q in enumerate(queries):
-        for field, expected_type in QUERY_SCHEMA.items():
-            if field not in q:
-                print(f"  [FAIL] queries[{i}] 缺少欄位: {field}")
-                q_field_errors += 1
-            elif not isinstance(q[field], expected_type):
-                print(
-                    f"  [FAIL] queries[{i}].{field} 型別錯誤: "
-                    f"{type(q[field]).__name__} (預期 {expected_type.__name__})"
-                )
-                q_field_errors += 1
-    if q_field_errors == 0:
+    if not q_field_msgs:
         print(f"  [PASS] Queries 欄位正確 ({len(QUERY_SCHEMA)} 個必要欄位)")
+    else:
+        print(*q_field_msgs, sep="\n")
 
-    c_field_errors = 0
-    for i, d in enumerate(corpus):
-        for field, expected_type in CORPUS_SCHEMA.items():
-            if field not in d:
-                print(f"  [FAIL] corpus[{i}] 缺少欄位: {field}")
-                c_field_errors += 1
-            elif not isinstance(d[field], expected_type):
-                print(
-                    f"  [FAIL] corpus[{i}].{field} 型別錯誤: "
-                    f"{type(d[field]).__name__} (預期 {expected_type.__name__})"
-                )
-                c_field_errors += 1
-    if c_field_errors == 0:
+    if not c_field_msgs:
         print(f"  [PASS] Corpus 欄位正確 ({len(CORPUS_SCHEMA)} 個必要欄位)")
+    else:
+        print(*c_field_msgs, sep="\n")
 
     # --- 3. 資料一致性 (Gold Doc IDs ∈ Corpus) ---
     print(f"\n[{label} - 3. 資料一致性]")
-    corpus_ids = {d.get("doc_id") for d in corpus}
+    q_id_set = set(q_ids)
+    doc_id_set = set(doc_ids)
+
+    # 先用一次 C 層級的集合差集找出缺失的 id，只在真的有缺失時才回頭配對 query
+    bad_gids = referenced - doc_id_set
     missing_docs = []
-    for q in queries:
-        for gid in q.get("gold_doc_ids", []):
-            if gid not in corpus_ids:
-                missing_docs.append((q.get("question_id"), gid))
+    if bad_gids:
+        missing_docs = [
+            (q.get("question_id"), gid)
+            for q in queries
+            for gid in q.get("gold_doc_ids", [])
+            if gid in bad_gids
+        ]
 
     if not missing_docs:
         print("  [PASS] 所有 Gold Doc IDs 皆存在於 Corpus")
@@ -162,19 +259,24 @@ def validate_pair(
     # --- 4. 無重複 Queries 或 Corpus ---
     print(f"\n[{label} - 4. 重複性檢查]")
 
-    q_ids = [q["question_id"] for q in queries]
-    dup_q_ids = [item for item, count in Counter(q_ids).items() if count > 1]
+    # 長度相同代表無重複 (常見情況)，可完全跳過 Counter 統計
+    if len(q_ids) != len(q_id_set):
+        dup_q_ids = [item for item, count in Counter(q_ids).items() if count > 1]
+    else:
+        dup_q_ids = []
     if not dup_q_ids:
-        print(f"  [PASS] Queries 無重複 ID ({len(q_ids)} unique)")
+        print(f"  [PASS] Queries 無重複 ID ({len(queries)} unique)")
     else:
         print(f"  [FAIL] 發現 {len(dup_q_ids)} 個重複 question_id:")
         for qid in dup_q_ids[:10]:
             print(f"    - {qid}")
 
-    doc_ids = [d["doc_id"] for d in corpus]
-    dup_doc_ids = [item for item, count in Counter(doc_ids).items() if count > 1]
+    if len(doc_ids) != len(doc_id_set):
+        dup_doc_ids = [item for item, count in Counter(doc_ids).items() if count > 1]
+    else:
+        dup_doc_ids = []
     if not dup_doc_ids:
-        print(f"  [PASS] Corpus 無重複 doc_id ({len(set(doc_ids))} unique)")
+        print(f"  [PASS] Corpus 無重複 doc_id ({len(doc_id_set)} unique)")
     else:
         print(f"  [FAIL] 發現 {len(dup_doc_ids)} 個重複 doc_id:")
         for did in dup_doc_ids[:10]:
@@ -204,6 +306,8 @@ def validate_pair(
         else:
             print(f"  [WARN] {c_errors} 篇可能未翻譯")
 
+    return q_id_set, doc_id_set
+
 
 def main():
     print("=" * 60)
@@ -212,11 +316,18 @@ def main():
 
     # --- 檔案存在性檢查 ---
     file_pairs = {
-        "Raw": (PROCESSED_DIR / "queries_raw.json", PROCESSED_DIR / "corpus_raw.json"),
-        "Processed": (PROCESSED_DIR / "queries.json", PROCESSED_DIR / "corpus.json"),
+        "Raw": (
+            PROCESSED_DIR / "queries_raw.json",
+            PROCESSED_DIR / "corpus_raw.jsonl",
+        ),
+        "Processed": (PROCESSED_DIR / "queries.json", PROCESSED_DIR / "corpus.jsonl"),
     }
 
     # --- 0. 檔案存在性檢查 ---
+    # 每組檔案只載入一次，連同 validate_pair 算出的 ID 集合一併快取，
+    # 供後面的交叉驗證重用，不再重新解析
+    loaded: dict[str, tuple[list[dict], list[dict], set, set]] = {}
+
     print("\n[0. 檔案存在性檢查]")
     for label, (q_path, c_path) in file_pairs.items():
         q_exists = q_path.exists()
@@ -227,13 +338,14 @@ def main():
         if q_exists and c_exists:
             try:
                 queries = load_json(q_path)
-                corpus = load_json(c_path)
-                validate_pair(
+                corpus = load_jsonl(c_path)
+                q_ids, doc_ids = validate_pair(
                     queries,
                     corpus,
                     label,
                     check_chinese=(label == "Processed"),
                 )
+                loaded[label] = (queries, corpus, q_ids, doc_ids)
             except Exception as e:
                 print(f"  [FAIL] {label} 資料讀取失敗: {e}")
         else:
@@ -245,24 +357,13 @@ def main():
             print(f"  [SKIP] {label} 驗證跳過 (缺少: {', '.join(missing)})")
 
     # --- Raw vs Processed 交叉一致性 ---
-    raw_q_path = file_pairs["Raw"][0]
-    raw_c_path = file_pairs["Raw"][1]
-    proc_q_path = file_pairs["Processed"][0]
-    proc_c_path = file_pairs["Processed"][1]
-
-    all_exist = all(
-        p.exists() for p in [raw_q_path, raw_c_path, proc_q_path, proc_c_path]
-    )
-
-    if all_exist:
+    if "Raw" in loaded and "Processed" in loaded:
         print(f"\n{'=' * 60}")
         print("[Raw vs Processed 交叉一致性]")
         print("=" * 60)
 
-        queries_raw = load_json(raw_q_path)
-        queries = load_json(proc_q_path)
-        corpus_raw = load_json(raw_c_path)
-        corpus = load_json(proc_c_path)
+        queries_raw, corpus_raw, r_ids, _ = loaded["Raw"]
+        queries, corpus, q_ids, _ = loaded["Processed"]
 
         # Queries 一致性
         if len(queries) == len(queries_raw):
@@ -272,8 +373,6 @@ def main():
                 f"  [FAIL] Queries 數量不一致 ({len(queries)} vs {len(queries_raw)})"
             )
 
-        q_ids = set(q["question_id"] for q in queries)
-        r_ids = set(q["question_id"] for q in queries_raw)
         if q_ids == r_ids:
             print("  [PASS] Queries ID 集合一致")
         else: